@@ -10,38 +10,191 @@ Calculates CVSS v3.1 and v4.0 scores from vector strings using the RedHat cvss l
 Usage:
     uv run cvss-calc.py "CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:H/SC:N/SI:N/SA:N"
     uv run cvss-calc.py "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H"
+    uv run cvss-calc.py --batch - < vectors.txt
 
 Output:
     Score: 9.3
     Severity: Critical
     Vector: CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:H/SC:N/SI:N/SA:N
 
+Batch mode reads one vector per line from stdin and writes one JSON object
+per line to stdout, reusing the interpreter and cvss library for every vector.
+Vectors that fail to score are emitted as {"vector": ..., "error": ...}.
+
 Requirements:
     uv (automatically installs cvss library on first run)
 """
 
+import math
 import sys
-import json
+from functools import lru_cache
+from itertools import product
 
-from cvss import CVSS3, CVSS4
+# Vector prefix -> version, most common version first. The cvss library and
+# json are imported only when needed, since plain v3.x base vectors never
+# touch the library and json is only used for output.
+_DISPATCH = {
+    "CVSS:3.1": "3.1",
+    "CVSS:4.0": "4.0",
+    "CVSS:3.0": "3.0",
+}
 
+# CVSS v3.x base metric -> allowed values, in specification order
+_CVSS3_VALUES = {
+    "AV": ("N", "A", "L", "P"),
+    "AC": ("L", "H"),
+    "PR": ("N", "L", "H"),
+    "UI": ("N", "R"),
+    "S": ("U", "C"),
+    "C": ("H", "L", "N"),
+    "I": ("H", "L", "N"),
+    "A": ("H", "L", "N"),
+}
 
-def calculate_score(vector_string):
-    """Calculate CVSS score from vector string."""
+# Base metrics in specification order (used for the clean vector)
+_CVSS3_BASE_METRICS = tuple(_CVSS3_VALUES)
+
+# CVSS v3.x base metric weights keyed by "metric:value" field. Scope has no
+# weight; it selects the impact formula and the PR weights instead.
+_CVSS3_WEIGHTS = {
+    "AV:N": 0.85, "AV:A": 0.62, "AV:L": 0.55, "AV:P": 0.2,
+    "AC:L": 0.77, "AC:H": 0.44,
+    "PR:N": 0.85, "PR:L": 0.62, "PR:H": 0.27,
+    "UI:N": 0.85, "UI:R": 0.62,
+    "C:H": 0.56, "C:L": 0.22, "C:N": 0.0,
+    "I:H": 0.56, "I:L": 0.22, "I:N": 0.0,
+    "A:H": 0.56, "A:L": 0.22, "A:N": 0.0,
+}
+
+# Privileges Required weights when Scope is Changed
+_CVSS3_PR_CHANGED = {"PR:N": 0.85, "PR:L": 0.68, "PR:H": 0.5}
+
+# "metric:value" field -> metric name, so parsing a field is a single lookup
+_CVSS3_FIELD_METRIC = {
+    f"{metric}:{value}": metric
+    for metric, values in _CVSS3_VALUES.items()
+    for value in values
+}
+
+
+def _cvss3_fields(metric):
+    """All "metric:value" fields for one CVSS v3.x base metric."""
+    return [f"{metric}:{value}" for value in _CVSS3_VALUES[metric]]
+
+
+def _cvss3_impact(s, c, i, a):
+    """Impact sub-score for Scope and the C/I/A fields."""
+    w = _CVSS3_WEIGHTS
+    iss = 1 - (1 - w[c]) * (1 - w[i]) * (1 - w[a])
+    if s == "S:C":
+        return 7.52 * (iss - 0.029) - 3.25 * (iss - 0.02) ** 15
+    return 6.42 * iss
+
+
+def _cvss3_exploitability(av, ac, pr, ui, s):
+    """Exploitability sub-score for the AV/AC/PR/UI fields and Scope."""
+    w = _CVSS3_WEIGHTS
+    pr_weight = _CVSS3_PR_CHANGED[pr] if s == "S:C" else w[pr]
+    return 8.22 * w[av] * w[ac] * pr_weight * w[ui]
+
+
+# Sub-scores for every metric combination (54 impact, 96 exploitability), so
+# scoring a vector is two table lookups instead of per-vector arithmetic
+_CVSS3_IMPACT = {
+    key: _cvss3_impact(*key)
+    for key in product(*map(_cvss3_fields, ("S", "C", "I", "A")))
+}
+_CVSS3_EXPLOITABILITY = {
+    key: _cvss3_exploitability(*key)
+    for key in product(*map(_cvss3_fields, ("AV", "AC", "PR", "UI", "S")))
+}
+
+
+def _round_up(value):
+    """CVSS v3.1 Roundup: smallest one-decimal number >= value, float-safe."""
+    int_input = round(value * 100000)
+    if int_input % 10000 == 0:
+        return int_input / 100000
+    return (math.floor(int_input / 10000) + 1) / 10
+
+
+def _severity(score):
+    """Map a CVSS v3.x score to its qualitative severity rating."""
+    if score == 0.0:
+        return "None"
+    if score <= 3.9:
+        return "Low"
+    if score <= 6.9:
+        return "Medium"
+    if score <= 8.9:
+        return "High"
+    return "Critical"
+
+
+def _fast_score(vector_string, version):
+    """Score a plain CVSS v3.x base vector without the cvss library.
+
+    Returns None unless the vector holds exactly the eight base metrics with
+    valid values, so temporal/environmental metrics and malformed input fall
+    through to the library for full validation and error reporting.
+    """
+    prefix, *fields = vector_string.split("/")
+    if prefix != f"CVSS:{version}" or len(fields) != 8:
+        return None
+
+    metrics = {}
+    for field in fields:
+        metric = _CVSS3_FIELD_METRIC.get(field)
+        if metric is None:
+            return None
+        metrics[metric] = field
+    if len(metrics) != 8:
+        return None
+
+    scope = metrics["S"]
+    impact = _CVSS3_IMPACT[scope, metrics["C"], metrics["I"], metrics["A"]]
+    exploitability = _CVSS3_EXPLOITABILITY[
+        metrics["AV"], metrics["AC"], metrics["PR"], metrics["UI"], scope
+    ]
+
+    if impact <= 0:
+        score = 0.0
+    elif scope == "S:C":
+        score = _round_up(min(1.08 * (impact + exploitability), 10))
+    else:
+        score = _round_up(min(impact + exploitability, 10))
+
+    return {
+        "version": version,
+        "vector": f"CVSS:{version}/" + "/".join(metrics[m] for m in _CVSS3_BASE_METRICS),
+        "score": score,
+        "severity": _severity(score)
+    }
+
+
+@lru_cache(maxsize=4096)
+def _score_vector(vector_string):
+    """Score a vector string; cached because batches repeat vectors often.
+
+    Callers must not mutate the returned dict (see calculate_score).
+    """
+
+    # Detect version from the "CVSS:X.Y" prefix
+    version = _DISPATCH.get(vector_string[:8])
+    if version is None:
+        raise ValueError("Unsupported CVSS version. Vector must start with CVSS:3.0, CVSS:3.1, or CVSS:4.0")
 
-    # Detect version
-    if vector_string.startswith("CVSS:4.0"):
+    # Plain v3.x base vectors are scored directly; everything else uses the library
+    if version == "4.0":
+        from cvss import CVSS4
         cvss_obj = CVSS4(vector_string)
-        version = "4.0"
-    elif vector_string.startswith("CVSS:3.1"):
-        cvss_obj = CVSS3(vector_string)
-        version = "3.1"
-    elif vector_string.startswith("CVSS:3.0"):
-        cvss_obj = CVSS3(vector_string)
-        version = "3.0"
     else:
-        print(f"Error: Unsupported CVSS version. Vector must start with CVSS:3.0, CVSS:3.1, or CVSS:4.0", file=sys.stderr)
-        sys.exit(1)
+        result = _fast_score(vector_string, version)
+        if result is not None:
+            return result
+
+        from cvss import CVSS3
+        cvss_obj = CVSS3(vector_string)
 
     # Get scores and severities
     scores = cvss_obj.scores()
@@ -57,9 +210,42 @@ def calculate_score(vector_string):
     }
 
 
+def calculate_score(vector_string):
+    """Calculate CVSS score from vector string."""
+    return dict(_score_vector(vector_string))
+
+
+def run_batch(lines):
+    """Score newline-delimited vectors, writing one JSON line per vector.
+
+    Returns the process exit code: 1 if any vector failed, else 0.
+    """
+    import json
+
+    exit_code = 0
+    for line in lines:
+        vector_string = line.strip()
+        if not vector_string:
+            continue
+
+        try:
+            result = calculate_score(vector_string)
+        except Exception as e:
+            result = {"vector": vector_string, "error": str(e)}
+            exit_code = 1
+
+        sys.stdout.write(json.dumps(result) + "\n")
+
+    return exit_code
+
+
 def main():
+    if sys.argv[1:] == ["--batch", "-"]:
+        sys.exit(run_batch(sys.stdin))
+
     if len(sys.argv) != 2:
         print("Usage: uv run cvss-calc.py <cvss-vector-string>", file=sys.stderr)
+        print("       uv run cvss-calc.py --batch - < vectors.txt", file=sys.stderr)
         print('Example: uv run cvss-calc.py "CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:H/SC:N/SI:N/SA:N"', file=sys.stderr)
         sys.exit(1)
 
@@ -74,8 +260,13 @@ def main():
         print(f"Vector: {result['vector']}")
 
         # Also output JSON for programmatic parsing
+        import json
         print(f"\nJSON: {json.dumps(result)}")
 
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
     except Exception as e:
         print(f"Error calculating CVSS score: {e}", file=sys.stderr)
         sys.exit(1)
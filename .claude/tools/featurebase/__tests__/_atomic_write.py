@@ -0,0 +1,31 @@
+"""Atomic file rewrite shared by the security test maintenance scripts"""
+
+import os
+
+def write_file(path, chunks, mode: int):
+    """Write chunks to path via a temp file and os.replace
+
+    Chunks are streamed straight to the fd, so callers can pass memoryview
+    slices of the original content instead of assembling a new copy. The
+    temp file is chmod'ed explicitly because the mode given to os.open is
+    masked by the umask, and the rewritten file should keep the original's
+    permission bits. The temp file is removed if any step fails.
+    """
+    tmp = f"{path}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        try:
+            os.fchmod(fd, mode)
+            for chunk in chunks:
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
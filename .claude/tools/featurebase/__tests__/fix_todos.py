@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """Fix TODO placeholders in security tests"""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _atomic_write import write_file
+
 # Map of test files to their wrapper parameters for security testing
 SECURITY_TEST_PARAMS = {
     "create-custom-field.unit.test.ts": {
@@ -61,56 +65,86 @@ SECURITY_TEST_PARAMS = {
     },
 }
 
+# Placeholder left by the security test scaffolding (ASCII, so matched as bytes)
+_TODO_BYTES = (
+    b"        // TODO: Add proper test implementation with scenario.input\n"
+    b"        // Pattern: await expect(wrapper.execute({ param: scenario.input }, testClient)).rejects.toThrow();"
+)
+
+_SKIP_BYTES = (
+    b"        // No string params for this wrapper, skip security test\n"
+    b"        expect(true).toBe(true);"
+)
+
+# Replacement snippets depend only on static params, so expand them once at import
+for _params in SECURITY_TEST_PARAMS.values():
+    if _params.get("skip"):
+        continue
+    _params["_traversal_repl"] = (
+        f"        await expect(\n"
+        f"          {_params['traversal_call']}\n"
+        f"        ).rejects.toThrow(/traversal|invalid|not allowed|Control characters/i);"
+    ).encode()
+    _params["_injection_repl"] = (
+        f"        await expect(\n"
+        f"          {_params['injection_call']}\n"
+        f"        ).rejects.toThrow(/invalid|characters|not allowed|Control characters/i);"
+    ).encode()
+del _params
+
+def _read_file(path):
+    """Read a file's bytes and permission bits with one open and fstat"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        return os.read(fd, st.st_size), st.st_mode & 0o777
+    finally:
+        os.close(fd)
+
 def fix_todos(filepath: Path, params: dict):
-    """Replace TODO placeholders with actual test implementations"""
-    content = filepath.read_text()
+    """Replace TODO placeholders with actual test implementations
+
+    Works on raw bytes to avoid decoding and re-encoding the whole file.
+    """
+    original, mode = _read_file(filepath)
+    content = original
 
     if params.get("skip"):
         # Replace with skip comments
-        content = content.replace(
-            "        // TODO: Add proper test implementation with scenario.input\n"
-            "        // Pattern: await expect(wrapper.execute({ param: scenario.input }, testClient)).rejects.toThrow();",
-            "        // No string params for this wrapper, skip security test\n"
-            "        expect(true).toBe(true);"
-        )
+        content = content.replace(_TODO_BYTES, _SKIP_BYTES)
     else:
-        # Find and replace the first TODO (Path Traversal)
-        content = content.replace(
-            "        // TODO: Add proper test implementation with scenario.input\n"
-            "        // Pattern: await expect(wrapper.execute({ param: scenario.input }, testClient)).rejects.toThrow();",
-            f"        await expect(\n"
-            f"          {params['traversal_call']}\n"
-            f"        ).rejects.toThrow(/traversal|invalid|not allowed|Control characters/i);",
-            1  # Replace only first occurrence
-        )
-
-        # Find and replace the second TODO (Command Injection)
-        content = content.replace(
-            "        // TODO: Add proper test implementation with scenario.input\n"
-            "        // Pattern: await expect(wrapper.execute({ param: scenario.input }, testClient)).rejects.toThrow();",
-            f"        await expect(\n"
-            f"          {params['injection_call']}\n"
-            f"        ).rejects.toThrow(/invalid|characters|not allowed|Control characters/i);"
-        )
-
-    filepath.write_text(content)
+        # Locate every TODO in one scan: the first is Path Traversal, the
+        # rest are Command Injection
+        head, *rest = content.split(_TODO_BYTES)
+        if rest:
+            content = head + params["_traversal_repl"] + params["_injection_repl"].join(rest)
+
+    # Reruns over already-fixed files leave them untouched
+    if content != original:
+        write_file(filepath, (content,), mode)
 
 def main():
     test_dir = Path(__file__).parent
 
     print("Fixing TODO placeholders in security tests\n")
 
+    # One directory read instead of a stat per listed file
+    present = {entry.name for entry in os.scandir(test_dir) if entry.is_file()}
+
+    def process(filename):
+        if filename not in present:
+            return False, [f"✗ {filename} - not found"]
+        fix_todos(test_dir / filename, SECURITY_TEST_PARAMS[filename])
+        return True, [f"Processing {filename}...", f"  ✓ Fixed TODOs"]
+
+    # Files are independent, so overlap their I/O across a thread pool
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(process, SECURITY_TEST_PARAMS))
+
     fixed_count = 0
-    for filename, params in SECURITY_TEST_PARAMS.items():
-        filepath = test_dir / filename
-        if not filepath.exists():
-            print(f"✗ {filename} - not found")
-            continue
-
-        print(f"Processing {filename}...")
-        fix_todos(filepath, params)
-        fixed_count += 1
-        print(f"  ✓ Fixed TODOs")
+    for fixed, lines in results:
+        print("\n".join(lines))
+        fixed_count += fixed
 
     print(f"\nCompleted: {fixed_count}/{len(SECURITY_TEST_PARAMS)} files fixed")
 